@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+dataset_trends의 트렌딩/이상치 판정을 합성 데이터로 점검하는 스크립트
+
+실행: python scripts/check_dataset_trends.py
+판정 기준(임계값 등)을 바꿀 때마다 실행해 실패하는 항목이 없는지 확인합니다.
+"""
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from dataset_trends import TRENDING_Z, compute_trend_scores, detect_trends, select_weekly_snapshots
+
+N_DATASETS = 200
+N_WEEKS = 10
+
+
+def weekly_dates(n_snapshots: int) -> List[str]:
+    """매주 월요일 간격의 스냅샷 날짜를 만듭니다."""
+    start = date(2025, 8, 4)
+    return [(start + timedelta(weeks=w)).strftime("%Y%m%d") for w in range(n_snapshots)]
+
+
+def make_history(downloads: np.ndarray, dates: Optional[List[str]] = None) -> Dict:
+    """(데이터셋 x 스냅샷) 배열로부터 detect_trends 입력을 만듭니다."""
+    if dates is None:
+        dates = weekly_dates(downloads.shape[1])
+
+    ids = [f"test/dataset-{i}" for i in range(downloads.shape[0])]
+    latest = {}
+    for dataset_id, value in zip(ids, downloads[:, -1]):
+        if not np.isnan(value):
+            latest[dataset_id] = {"id": dataset_id, "author": "test", "url": "", "downloads": int(value)}
+
+    return {"dates": dates, "ids": ids, "downloads": downloads, "latest": latest}
+
+
+def flat_downloads() -> np.ndarray:
+    """다운로드 규모는 다양하지만 매주 일정하게 증가하는 이력을 만듭니다."""
+    levels = np.logspace(0, 5, N_DATASETS)
+    return levels[:, None] + np.arange(N_WEEKS)[None, :] * 3.0
+
+
+def check_flat_history_is_quiet():
+    """변화가 없는 이력에서는 아무것도 검출되지 않아야 합니다."""
+    result = detect_trends(make_history(flat_downloads()))
+    assert result["trending"] == [], result["trending"]
+    assert result["anomalous"] == [], result["anomalous"]
+
+
+def check_noise_on_small_datasets_is_quiet():
+    """
+    다운로드가 적은 데이터셋의 작은 흔들림은 큰 z-score가 되지 않아야 합니다.
+    ±1로 번갈아 흔들리다가 마지막 주에 2 * sqrt(다운로드 수)만큼 늘어난 이력은
+    sqrt(다운로드 수) 하한이 없으면 z-score가 TRENDING_Z를 넘습니다.
+    """
+    levels = np.linspace(20, 400, N_DATASETS)
+    jitter = np.where(np.arange(N_WEEKS) % 2 == 0, 1.0, -1.0)
+    downloads = levels[:, None] + jitter[None, :]
+    downloads[:, -1] = downloads[:, -2] + 2 * np.sqrt(levels)
+
+    scores = compute_trend_scores(downloads, weekly_dates(N_WEEKS))
+    assert np.all(scores["z_score"] < TRENDING_Z), scores["z_score"].max()
+
+    result = detect_trends(make_history(downloads))
+    assert result["trending"] == [], result["trending"]
+    assert result["anomalous"] == [], result["anomalous"]
+
+
+def check_uneven_intervals_are_normalized():
+    """
+    스냅샷 간격이 2주인 구간의 변화량은 주 단위로 나뉘어야 합니다.
+    매주 같은 속도로 증가하는 이력은 간격과 무관하게 조용해야 합니다.
+    """
+    start = date(2025, 8, 4)
+    offsets = [0, 7, 14, 28, 35, 42, 56, 63, 70, 84]
+    dates = [(start + timedelta(days=d)).strftime("%Y%m%d") for d in offsets]
+    levels = np.logspace(0, 5, N_DATASETS)
+    downloads = levels[:, None] + np.array(offsets)[None, :] / 7.0 * 30.0
+
+    scores = compute_trend_scores(downloads, dates)
+    assert np.allclose(scores["velocity"], 30.0), scores["velocity"]
+    assert np.allclose(scores["acceleration"], 0.0), scores["acceleration"]
+
+    result = detect_trends(make_history(downloads, dates))
+    assert result["trending"] == [], result["trending"]
+    assert result["anomalous"] == [], result["anomalous"]
+
+
+def check_spike_and_drop_are_flagged():
+    """주입한 급증/급감이 올바른 방향으로 검출되어야 합니다."""
+    downloads = flat_downloads()
+    spike_row, drop_row = 120, 150
+    downloads[spike_row, -1] += 5000
+    downloads[drop_row, -1] -= 3000
+
+    result = detect_trends(make_history(downloads))
+    anomalous = {entry["id"]: entry["direction"] for entry in result["anomalous"]}
+    assert anomalous == {
+        f"test/dataset-{spike_row}": "spike",
+        f"test/dataset-{drop_row}": "drop"
+    }, anomalous
+    assert [entry["id"] for entry in result["trending"]] == [f"test/dataset-{spike_row}"], result["trending"]
+
+
+def check_missing_or_short_history_is_excluded():
+    """최신 스냅샷이 없거나 기준선이 부족한 데이터셋은 제외되어야 합니다."""
+    downloads = flat_downloads()
+    missing_row, short_row = 120, 150
+    downloads[missing_row, -1] = np.nan
+    downloads[missing_row, -2] += 5000
+    downloads[short_row, :-4] = np.nan
+    downloads[short_row, -1] += 5000
+
+    result = detect_trends(make_history(downloads))
+    flagged = {entry["id"] for entry in result["trending"] + result["anomalous"]}
+    assert flagged == set(), flagged
+
+
+def check_rerun_snapshots_are_collapsed():
+    """하루 뒤 재실행한 스냅샷은 직전 주간 스냅샷을 대체해야 합니다."""
+    files = [f"korean_datasets_{d}.json" for d in ["20251006", "20251013", "20251020", "20251021"]]
+    selected = select_weekly_snapshots(files)
+    assert selected == [files[0], files[1], files[3]], selected
+
+
+CHECKS = [
+    check_flat_history_is_quiet,
+    check_noise_on_small_datasets_is_quiet,
+    check_uneven_intervals_are_normalized,
+    check_spike_and_drop_are_flagged,
+    check_missing_or_short_history_is_excluded,
+    check_rerun_snapshots_are_collapsed,
+]
+
+
+def main():
+    """메인 실행 함수"""
+    print("=" * 60)
+    print("트렌드 탐지 점검")
+    print("=" * 60)
+
+    for check in CHECKS:
+        check()
+        print(f"  ✓ {check.__name__}")
+
+    print("\n" + "=" * 60)
+    print("모든 점검 통과!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
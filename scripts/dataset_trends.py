@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+주간 다운로드 변화량으로부터 데이터셋별 트렌드와 이상치를 찾는 스크립트
+
+아카이브 스냅샷을 (데이터셋 x 스냅샷) 배열로 정렬한 뒤, 데이터셋마다
+속도(주간 다운로드 변화량), 가속도, 자기 자신의 이동 기준선 대비 z-score를
+NumPy로 한 번에 계산합니다.
+"""
+import json
+import os
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+
+ARCHIVE_DIR = "docs/data/archive"
+
+# 이동 기준선에 사용할 과거 주간 변화량 개수
+BASELINE_WINDOW = 8
+# z-score를 계산하기 위한 최소 기준선 길이
+MIN_BASELINE_POINTS = 3
+# 이보다 가까운 스냅샷(수동 재실행 등)은 주간 포인트 하나로 합칩니다
+MIN_SNAPSHOT_GAP_DAYS = 6
+# 변화가 거의 없는 데이터셋의 표준편차 하한 (주간 다운로드 수)
+MIN_BASELINE_STD = 1.0
+# 트렌딩 / 이상치 판정 기준 (z 기준은 검사하는 데이터셋 수에 따라 상향됩니다)
+TRENDING_Z = 3.0
+ANOMALY_Z = 5.0
+MIN_TRENDING_DELTA = 20
+MIN_ANOMALY_DELTA = 50
+MAX_RESULTS = 50
+
+
+def list_archive_files(archive_dir: str = ARCHIVE_DIR) -> List[str]:
+    """날짜순으로 정렬된 데이터셋 아카이브 파일 목록을 반환합니다."""
+    if not os.path.isdir(archive_dir):
+        return []
+
+    files = sorted([f for f in os.listdir(archive_dir) if f.startswith("korean_datasets_") and f.endswith(".json")])
+    return [os.path.join(archive_dir, f) for f in files]
+
+
+def _snapshot_date(file_path: str) -> str:
+    """아카이브 파일명에서 날짜(YYYYMMDD)를 추출합니다."""
+    return os.path.basename(file_path).replace("korean_datasets_", "").replace(".json", "")
+
+
+def select_weekly_snapshots(file_paths: List[str], min_gap_days: int = MIN_SNAPSHOT_GAP_DAYS) -> List[str]:
+    """
+    최신 스냅샷부터 거꾸로 훑으며 직전에 선택한 스냅샷과 `min_gap_days`일 이상
+    떨어진 것만 남깁니다. 하루 뒤 재실행처럼 가까운 스냅샷은 더 최신 것 하나로 합쳐지므로
+    짧은 간격의 변화량을 주간 값으로 부풀리지 않습니다.
+    """
+    selected = []
+    last_ordinal = None
+    for file_path in reversed(file_paths):
+        ordinal = datetime.strptime(_snapshot_date(file_path), "%Y%m%d").toordinal()
+        if last_ordinal is None or last_ordinal - ordinal >= min_gap_days:
+            selected.append(file_path)
+            last_ordinal = ordinal
+
+    return selected[::-1]
+
+
+def load_download_history(file_paths: List[str]) -> Dict:
+    """
+    스냅샷들을 (데이터셋 x 스냅샷) 다운로드 배열로 정렬합니다.
+    해당 스냅샷에 없는 데이터셋은 NaN으로 채웁니다.
+    """
+    dates = []
+    columns = []
+    index = {}
+    latest = []
+
+    for file_path in file_paths:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        dates.append(_snapshot_date(file_path))
+        rows = [index.setdefault(ds["id"], len(index)) for ds in data["datasets"]]
+        downloads = [ds["downloads"] for ds in data["datasets"]]
+        columns.append((np.asarray(rows, dtype=np.intp), np.asarray(downloads, dtype=np.float64)))
+        latest = data["datasets"]
+
+    matrix = np.full((len(index), len(columns)), np.nan)
+    for col, (rows, downloads) in enumerate(columns):
+        matrix[rows, col] = downloads
+
+    return {
+        "dates": dates,
+        "ids": list(index),
+        "downloads": matrix,
+        "latest": {ds["id"]: ds for ds in latest}
+    }
+
+
+def compute_trend_scores(downloads: np.ndarray, dates: List[str],
+                         window: int = BASELINE_WINDOW) -> Dict:
+    """
+    데이터셋별 속도, 가속도, z-score를 계산합니다.
+
+    속도는 스냅샷 간격(주 단위)으로 정규화한 다운로드 변화량이며,
+    z-score는 최신 속도를 직전 `window`개 속도의 평균/표본표준편차와 비교한 값입니다.
+    표준편차에는 직전 다운로드 수의 제곱근을 하한으로 두어, 다운로드가 적은 데이터셋의
+    작은 흔들림이 큰 z-score로 보이지 않게 합니다.
+    """
+    n_datasets = downloads.shape[0]
+    empty = np.full(n_datasets, np.nan)
+    if downloads.shape[1] < 2:
+        return {"velocity": empty, "acceleration": empty, "z_score": empty,
+                "baseline_mean": empty, "baseline_std": empty}
+
+    ordinals = np.array([datetime.strptime(d, "%Y%m%d").toordinal() for d in dates], dtype=np.float64)
+    weeks = np.maximum(np.diff(ordinals), 1.0) / 7.0
+
+    velocity = np.diff(downloads, axis=1) / weeks
+    latest_velocity = velocity[:, -1]
+
+    acceleration = empty
+    if velocity.shape[1] >= 2:
+        acceleration = (velocity[:, -1] - velocity[:, -2]) / weeks[-1]
+
+    baseline = velocity[:, -window - 1:-1]
+    valid = ~np.isnan(baseline)
+    counts = valid.sum(axis=1)
+    enough = counts >= MIN_BASELINE_POINTS
+
+    # 기준선이 부족한 데이터셋은 NaN으로 남깁니다 (경고 없이 계산하기 위해 0으로 채운 뒤 마스킹)
+    filled = np.where(valid, baseline, 0.0)
+    mean = filled.sum(axis=1) / np.maximum(counts, 1)
+    var = (np.where(valid, baseline - mean[:, None], 0.0) ** 2).sum(axis=1) / np.maximum(counts - 1, 1)
+    level = np.nan_to_num(downloads[:, -2], nan=0.0)
+    std = np.maximum(np.sqrt(var), np.maximum(np.sqrt(np.maximum(level, 0.0)), MIN_BASELINE_STD))
+
+    z_score = np.where(enough, (latest_velocity - mean) / std, np.nan)
+
+    return {
+        "velocity": latest_velocity,
+        "acceleration": acceleration,
+        "z_score": z_score,
+        "baseline_mean": np.where(enough, mean, np.nan),
+        "baseline_std": np.where(enough, std, np.nan)
+    }
+
+
+def scaled_threshold(base: float, n_tested: int) -> float:
+    """
+    검사하는 데이터셋 수가 많을수록 우연히 큰 z-score가 나오므로,
+    정규분포 최댓값의 기대 크기 sqrt(2 ln n)보다 낮아지지 않도록 기준을 올립니다.
+    """
+    if n_tested < 2:
+        return base
+    return max(base, float(np.sqrt(2.0 * np.log(n_tested))))
+
+
+def _round_or_none(value: float):
+    """NaN은 JSON에서 null이 되도록 None으로 변환합니다."""
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+def _build_entries(order: np.ndarray, history: Dict, scores: Dict) -> List[Dict]:
+    """선택된 행 인덱스를 출력용 레코드 목록으로 변환합니다."""
+    entries = []
+    for row in order:
+        dataset_id = history["ids"][row]
+        current = history["latest"].get(dataset_id, {})
+        velocity = scores["velocity"][row]
+
+        entries.append({
+            "id": dataset_id,
+            "author": current.get("author"),
+            "url": current.get("url"),
+            "downloads": current.get("downloads"),
+            "velocity": _round_or_none(velocity),
+            "acceleration": _round_or_none(scores["acceleration"][row]),
+            "z_score": _round_or_none(scores["z_score"][row]),
+            "baseline_mean": _round_or_none(scores["baseline_mean"][row]),
+            "direction": "spike" if velocity > 0 else "drop"
+        })
+
+    return entries
+
+
+def detect_trends(history: Dict, window: int = BASELINE_WINDOW) -> Dict:
+    """트렌딩 데이터셋과 이상 변동 데이터셋 목록을 생성합니다."""
+    scores = compute_trend_scores(history["downloads"], history["dates"], window)
+    z_score = scores["z_score"]
+    velocity = scores["velocity"]
+
+    n_tested = int(np.count_nonzero(~np.isnan(z_score)))
+    trending_z = scaled_threshold(TRENDING_Z, n_tested)
+    anomaly_z = scaled_threshold(ANOMALY_Z, n_tested)
+
+    # NaN 비교는 False이므로 기준선이 부족한 데이터셋은 자동으로 제외됩니다
+    with np.errstate(invalid="ignore"):
+        trending_mask = (z_score >= trending_z) & (velocity >= MIN_TRENDING_DELTA)
+        anomalous_mask = (np.abs(z_score) >= anomaly_z) & (np.abs(velocity) >= MIN_ANOMALY_DELTA)
+
+    trending_rows = np.flatnonzero(trending_mask)
+    trending_rows = trending_rows[np.argsort(-z_score[trending_rows], kind="stable")][:MAX_RESULTS]
+
+    anomalous_rows = np.flatnonzero(anomalous_mask)
+    anomalous_rows = anomalous_rows[np.argsort(-np.abs(z_score[anomalous_rows]), kind="stable")][:MAX_RESULTS]
+
+    return {
+        "trending": _build_entries(trending_rows, history, scores),
+        "anomalous": _build_entries(anomalous_rows, history, scores),
+        "baseline_window": window,
+        "snapshots_used": len(history["dates"]),
+        "snapshot_date": history["dates"][-1]
+    }
+
+
+def generate_dataset_trends(archive_dir: str = ARCHIVE_DIR, window: int = BASELINE_WINDOW) -> Dict:
+    """
+    아카이브로부터 트렌딩/이상치 목록을 생성합니다.
+    기준선 계산에 필요한 최근 `window + 2`개 주간 스냅샷만 읽으므로
+    아카이브가 길어져도 매주 실행 비용이 일정하게 유지됩니다.
+    """
+    file_paths = select_weekly_snapshots(list_archive_files(archive_dir))[-(window + 2):]
+    if len(file_paths) < 2:
+        return {"trending": [], "anomalous": [], "baseline_window": window, "snapshots_used": len(file_paths),
+                "snapshot_date": _snapshot_date(file_paths[-1]) if file_paths else None}
+
+    history = load_download_history(file_paths)
+    return detect_trends(history, window)
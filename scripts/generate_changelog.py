@@ -31,6 +31,28 @@ def get_latest_two_archives() -> tuple:
     return previous_file, current_file
 
 
+def load_dataset_trends(current_date: str, trends_file: str = "docs/data/trends.json") -> Dict:
+    """
+    generate_trends.py가 저장한 트렌딩/이상 변동 목록을 읽어옵니다.
+    같은 스냅샷으로 계산된 목록이 아니면 빈 목록을 반환합니다.
+    """
+    empty = {"trending": [], "anomalous": []}
+    trend_data = load_dataset(trends_file)
+    if not trend_data:
+        print(f"Trend data not found: {trends_file}")
+        return empty
+
+    trends = trend_data.get("trends", {})
+    if trends.get("dataset_trends_date") != current_date:
+        print(f"Trend data is not for {current_date} (found: {trends.get('dataset_trends_date')})")
+        return empty
+
+    return {
+        "trending": trends.get("trending", []),
+        "anomalous": trends.get("anomalous", [])
+    }
+
+
 def compare_datasets(previous_data: Dict, current_data: Dict) -> Dict:
     """두 데이터셋을 비교하여 변경사항을 찾습니다."""
     if not previous_data or not current_data:
@@ -124,6 +146,11 @@ def generate_changelog() -> Dict:
     previous_date = os.path.basename(previous_file).replace("korean_datasets_", "").replace(".json", "")
     current_date = os.path.basename(current_file).replace("korean_datasets_", "").replace(".json", "")
 
+    # 트렌딩/이상 변동 목록은 generate_trends.py의 결과를 그대로 사용
+    dataset_trends = load_dataset_trends(current_date)
+    changes["trending"] = dataset_trends["trending"]
+    changes["anomalous"] = dataset_trends["anomalous"]
+
     changelog = {
         "generated_at": datetime.now().isoformat(),
         "previous_date": previous_date,
@@ -136,6 +163,8 @@ def generate_changelog() -> Dict:
             "removed_count": len(changes["removed_datasets"]),
             "updated_count": len(changes["updated_datasets"]),
             "unchanged_count": changes["unchanged_count"],
+            "trending_count": len(changes["trending"]),
+            "anomalous_count": len(changes["anomalous"]),
             "net_change": len(changes["new_datasets"]) - len(changes["removed_datasets"])
         }
     }
@@ -167,6 +196,8 @@ def main():
     print(f"  Removed datasets: {changelog['summary']['removed_count']}")
     print(f"  Updated datasets: {changelog['summary']['updated_count']}")
     print(f"  Unchanged datasets: {changelog['summary']['unchanged_count']}")
+    print(f"  Trending datasets: {changelog['summary']['trending_count']}")
+    print(f"  Anomalous datasets: {changelog['summary']['anomalous_count']}")
     print(f"  Net change: {changelog['summary']['net_change']:+d}")
 
     print("\n" + "=" * 60)
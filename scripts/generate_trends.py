@@ -8,6 +8,8 @@ from datetime import datetime
 from typing import List, Dict
 import glob
 
+from dataset_trends import generate_dataset_trends
+
 
 def load_archived_statistics() -> List[Dict]:
     """아카이브된 통계 파일들을 로드합니다."""
@@ -95,6 +97,12 @@ def main():
     # 트렌드 데이터 생성
     trend_data = generate_trend_data(all_stats)
 
+    # 데이터셋별 트렌딩/이상 변동 탐지
+    dataset_trends = generate_dataset_trends()
+    trend_data["trending"] = dataset_trends["trending"]
+    trend_data["anomalous"] = dataset_trends["anomalous"]
+    trend_data["dataset_trends_date"] = dataset_trends["snapshot_date"]
+
     # 트렌드 데이터 저장
     output_file = "docs/data/trends.json"
     with open(output_file, 'w', encoding='utf-8') as f:
@@ -107,6 +115,8 @@ def main():
     print(f"  - 기간: {trend_data['first_date']} ~ {trend_data['last_date']}")
     print(f"  - 총 주차: {trend_data['total_weeks']}")
     print(f"  - 성장률: {trend_data['growth_rate']}%")
+    print(f"  - 트렌딩 데이터셋: {len(trend_data['trending'])}")
+    print(f"  - 이상 변동 데이터셋: {len(trend_data['anomalous'])}")
 
     print("\n" + "=" * 60)
     print("생성 완료!")